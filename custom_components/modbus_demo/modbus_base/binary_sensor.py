@@ -9,7 +9,11 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.core import callback
 
 from .coordinator import BaseModbusUpdateCoordinator
-from .entity import BaseModbusEntity, SimpleModbusEntityDescription
+from .entity import (
+    BaseModbusEntity,
+    SimpleModbusEntityDescription,
+    validate_scalar_register,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -33,18 +37,14 @@ class SimpleModbusBinarySensorEntity(BaseModbusEntity, BinarySensorEntity):
         description: SimpleModbusBinarySensorEntityDescription,
     ) -> None:
         """Initialize the Modbus binary sensor."""
+        validate_scalar_register(description)
         super().__init__(coordinator, description)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and (
-            values := self.coordinator.data.get(self.entity_description.modbus_register)
-        ):
-            assert len(values) == 1, (
-                "Expected exactly one register value "
-                "for a SimpleModbusBinarySensorEntity"
-            )
+        data = self.coordinator.data
+        if data is not None and (values := data.get(self._register)) is not None:
             value = values[0]
 
             if value == self.entity_description.on_value:
@@ -35,12 +35,8 @@ class SimpleModbusButtonEntity(BaseModbusEntity, ButtonEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # For buttons, just track availability based on having data for the register
-        if self.coordinator.data and (
-            self.entity_description.modbus_register in self.coordinator.data
-        ):
-            self._attr_available = True
-        else:
-            self._attr_available = False
+        data = self.coordinator.data
+        self._attr_available = data is not None and self._register in data
         self.async_write_ha_state()
 
     async def async_press(self) -> None:
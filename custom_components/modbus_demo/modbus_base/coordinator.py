@@ -1,14 +1,17 @@
 """Base Modbus DataUpdateCoordinator."""
 
+import asyncio
 import logging
 import struct
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import timedelta
-from itertools import chain
+from functools import lru_cache
+from itertools import chain, filterfalse
+from operator import attrgetter
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -23,8 +26,18 @@ from .const import MODBUS_REGISTERS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared Struct singletons for the register factories: struct.Struct objects
+# are immutable, so every register of the same type can reference the same
+# compiled instance instead of allocating its own.
+_UINT16_STRUCT = struct.Struct(">H")
+_INT16_STRUCT = struct.Struct(">h")
+_UINT32_STRUCT = struct.Struct(">I")
+_INT32_STRUCT = struct.Struct(">i")
+_FLOAT32_STRUCT = struct.Struct(">f")
+_FLOAT64_STRUCT = struct.Struct(">d")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ModbusRegister:
     """Modbus register definition."""
 
@@ -36,69 +49,120 @@ class ModbusRegister:
     input_register: bool = False
     """Whether this is an input register."""
 
+    skip_updates: int = 0
+    """
+    Number of poll cycles to skip between updates of this register.
+
+    Registers that rarely change (serial numbers, firmware versions, ...) can
+    be polled less often than the coordinator's update interval by setting
+    this to a non-zero value.
+    """
+
+    plain_format: str = field(init=False, compare=False, repr=False)
+    """Struct format stripped of its byte-order prefix, cached for batching."""
+
+    value_count: int = field(init=False, compare=False, repr=False)
+    """Number of values decoded from this register's struct format."""
+
+    _hash: int = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Cache derived attributes of the struct format."""
+        plain_format = self.struct_format.format.lstrip(">")
+        object.__setattr__(self, "plain_format", plain_format)
+        object.__setattr__(
+            self,
+            "value_count",
+            len(WordOrderAwareStruct.parse_format_lengths(plain_format)),
+        )
+        object.__setattr__(
+            self, "_hash", hash((self.address, self.input_register, plain_format))
+        )
+
+    def __hash__(self) -> int:
+        """
+        Return the hash precomputed at construction time.
+
+        Registers are used as keys of coordinator.data, so they are hashed on
+        every entity update callback. The generated dataclass hash rebuilds a
+        field tuple per call; returning the cached value makes the lookup as
+        cheap as an attribute read.
+        """
+        return self._hash
+
+    def pack_words(self, *values: Any) -> tuple[int, ...]:
+        """Pack the given values into raw 16-bit register words."""
+        return _bytes_to_words(self.struct_format.pack(*values))
+
     @classmethod
+    @lru_cache
     def create_uint16_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for an unsigned 16-bit integer."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">H"),
+            struct_format=_UINT16_STRUCT,
             input_register=input_register,
         )
 
     @classmethod
+    @lru_cache
     def create_int16_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for a signed 16-bit integer."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">h"),
+            struct_format=_INT16_STRUCT,
             input_register=input_register,
         )
 
     @classmethod
+    @lru_cache
     def create_uint32_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for an unsigned 32-bit integer."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">I"),
+            struct_format=_UINT32_STRUCT,
             input_register=input_register,
         )
 
     @classmethod
+    @lru_cache
     def create_int32_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for a signed 32-bit integer."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">i"),
+            struct_format=_INT32_STRUCT,
             input_register=input_register,
         )
 
     @classmethod
+    @lru_cache
     def create_float32_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for a 32-bit float."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">f"),
+            struct_format=_FLOAT32_STRUCT,
             input_register=input_register,
         )
 
     @classmethod
+    @lru_cache
     def create_float64_register(
         cls, address: int, *, input_register: bool = False
     ) -> "ModbusRegister":
         """Create a Modbus register definition for a 64-bit float."""
         return cls(
             address=address,
-            struct_format=struct.Struct(">d"),
+            struct_format=_FLOAT64_STRUCT,
             input_register=input_register,
         )
 
@@ -129,143 +193,607 @@ class BaseModbusUpdateCoordinator(
             request_refresh_debouncer=request_refresh_debouncer,
         )
         self.client = client
+        self._update_tick = -1
+        self._batched_plans: dict[
+            frozenset[ModbusRegister], dict[bool, list[_RegisterBatch]]
+        ] = {}
+        self._all_registers: frozenset[ModbusRegister] | None = None
+        self._has_skipped_registers = False
+        self._listeners_by_register: (
+            dict[ModbusRegister, list[CALLBACK_TYPE]] | None
+        ) = None
+        self._pending_writes: list[
+            tuple[ModbusRegister, Any, tuple[int, ...], asyncio.Future[None]]
+        ] = []
+        self._write_flush_scheduled = False
         assert client.connected, (
             "Coordinator expects a connected Modbus client at initialization time"
         )
 
+    @callback
+    def _invalidate_batched_plans(self) -> None:
+        """Drop cached register sets and batching plans after listener changes."""
+        self._batched_plans.clear()
+        self._all_registers = None
+        self._listeners_by_register = None
+
+    @callback
+    def _get_listeners_by_register(self) -> dict[ModbusRegister, list[CALLBACK_TYPE]]:
+        """
+        Return the per-register listener index, rebuilding it if needed.
+
+        The index turns targeted listener updates into a dict lookup instead
+        of a scan over every registered listener's context. It is rebuilt
+        lazily after listener changes.
+        """
+        listeners_by_register = self._listeners_by_register
+        if listeners_by_register is None:
+            listeners_by_register = {}
+            for update_callback, context in self._listeners.values():
+                if isinstance(context, dict):
+                    for register in context.get(MODBUS_REGISTERS, ()):
+                        listeners_by_register.setdefault(register, []).append(
+                            update_callback
+                        )
+            self._listeners_by_register = listeners_by_register
+        return listeners_by_register
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, invalidating cached plans on changes."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._invalidate_batched_plans()
+
+        if not self.data:
+            # Entities attaching before any data exists (the
+            # update_before_add=False startup path): fetch their registers
+            # promptly instead of waiting a full update interval. The request
+            # debouncer coalesces the refreshes of an entity burst.
+            self.hass.async_create_task(self.async_request_refresh())
+
+        @callback
+        def remove_listener_and_invalidate() -> None:
+            remove_listener()
+            self._invalidate_batched_plans()
+
+        return remove_listener_and_invalidate
+
+    @callback
+    def async_update_listeners_for(self, register: ModbusRegister) -> None:
+        """
+        Update only the listeners subscribed to the given register.
+
+        After writing a single register there is no point in re-running the
+        update callback of every entity; only the entities tracking that
+        register can have changed.
+        """
+        for update_callback in list(
+            self._get_listeners_by_register().get(register, ())
+        ):
+            update_callback()
+
+    @callback
+    def async_update_listeners_for_registers(
+        self, registers: Iterable[ModbusRegister]
+    ) -> None:
+        """
+        Update only the listeners subscribed to any of the given registers.
+
+        Each listener is invoked at most once, even when several of its
+        registers changed at the same time.
+        """
+        listeners_by_register = self._get_listeners_by_register()
+        # An insertion-ordered dict doubles as a dedup set here, so listeners
+        # subscribed to several changed registers only fire once.
+        to_fire: dict[CALLBACK_TYPE, None] = {}
+        for register in registers:
+            for update_callback in listeners_by_register.get(register, ()):
+                to_fire[update_callback] = None
+        for update_callback in to_fire:
+            update_callback()
+
+    @callback
+    def queue_write(
+        self,
+        register: ModbusRegister,
+        values: tuple[Any, ...],
+        words: tuple[int, ...] | None = None,
+    ) -> asyncio.Future[None]:
+        """
+        Queue a register write and return a future resolving once it is done.
+
+        Writes queued within the same event-loop iteration (scene activations,
+        group toggles, ...) are flushed together, fusing writes to adjacent
+        holding registers into a single request instead of paying one round
+        trip per entity.
+
+        The values tuple is stored into coordinator.data as-is on success;
+        callers writing fixed values can pass cached tuples (and their
+        precomputed word form) to keep the write path allocation-free.
+        """
+        if words is None:
+            words = register.pack_words(*values)
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_writes.append((register, values, words, future))
+        if not self._write_flush_scheduled:
+            self._write_flush_scheduled = True
+            self.hass.async_create_task(self._flush_pending_writes())
+        return future
+
+    async def _flush_pending_writes(self) -> None:
+        """Flush all queued writes, one request per contiguous address run."""
+        self._write_flush_scheduled = False
+        pending = self._pending_writes
+        self._pending_writes = []
+        if not pending:
+            return
+
+        pending.sort(key=lambda item: item[0].address)
+
+        runs: list[
+            list[tuple[ModbusRegister, Any, tuple[int, ...], asyncio.Future[None]]]
+        ] = []
+        start = 0
+        while start < len(pending):
+            end = start + 1
+            run_word_count = len(pending[start][2])
+            run_end_address = pending[start][0].address + run_word_count
+            while (
+                end < len(pending)
+                and pending[end][0].address == run_end_address
+                # The size limit is measured in words: function code 16
+                # allows at most MAX_WRITE_REGISTERS_COUNT registers.
+                and run_word_count + len(pending[end][2])
+                <= MAX_WRITE_REGISTERS_COUNT
+            ):
+                word_count = len(pending[end][2])
+                run_word_count += word_count
+                run_end_address += word_count
+                end += 1
+            runs.append(pending[start:end])
+            start = end
+
+        # The runs are independent, but the tmodbus transport serializes
+        # requests behind its communication lock, so they do not overlap on
+        # the wire. Gathering them still keeps the request queue fed
+        # back-to-back instead of paying event-loop latency between runs.
+        written: list[ModbusRegister] = []
+        await asyncio.gather(*(self._write_run(run, written) for run in runs))
+
+        if written:
+            self.async_update_listeners_for_registers(written)
+
+    async def _write_run(
+        self,
+        run: list[tuple[ModbusRegister, Any, tuple[int, ...], asyncio.Future[None]]],
+        written: list[ModbusRegister],
+    ) -> None:
+        """Write one contiguous run of queued writes as a single request."""
+        try:
+            if len(run) == 1:
+                words = run[0][2]
+            else:
+                combined: list[int] = []
+                for item in run:
+                    combined.extend(item[2])
+                words = tuple(combined)
+            await self.client.write_multiple_registers(run[0][0].address, words)
+        except Exception as err:  # noqa: BLE001
+            # Every failure must reach the futures: an exception escaping
+            # the flush would leave callers awaiting queue_write hanging.
+            for _, _, _, future in run:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        data = self.data
+        for register, values, _, future in run:
+            if data is not None:
+                data[register] = values
+            written.append(register)
+            if not future.done():
+                future.set_result(None)
+
     async def _async_update_data(self) -> dict[ModbusRegister, tuple[Any, ...]]:
-        modbus_registers = set(
-            chain.from_iterable(ctx[MODBUS_REGISTERS] for ctx in self.async_contexts())
-        )
+        # Connection healing happens inside the tmodbus smart transport: with
+        # auto_reconnect enabled it re-opens the session from within
+        # send_and_receive (with its own retry policy), so a lost session
+        # surfaces here as a TModbusError turned into UpdateFailed below.
+        # client.connected cannot be used as a probe for an explicit
+        # reconnect: the smart transport reports itself open whenever a
+        # reconnect is pending.
+        self._update_tick += 1
+        tick = self._update_tick
+
+        all_registers = self._all_registers
+        if all_registers is None:
+            # Listener set changed (or first poll): re-collect the registers.
+            # On the common path of a stable entity set, the cached frozenset
+            # is reused without re-hashing any register.
+            all_registers = frozenset(
+                chain.from_iterable(
+                    ctx[MODBUS_REGISTERS] for ctx in self.async_contexts()
+                )
+            )
+            self._all_registers = all_registers
+            self._has_skipped_registers = any(
+                reg.skip_updates for reg in all_registers
+            )
+
+        if self._has_skipped_registers:
+            # Registers with skip_updates are only due every n-th poll cycle.
+            # The first poll (tick 0) always reads everything.
+            modbus_registers = frozenset(
+                reg for reg in all_registers if tick % (reg.skip_updates + 1) == 0
+            )
+        else:
+            modbus_registers = all_registers
+
         if not modbus_registers:
             _LOGGER.debug("No Modbus registers to update")
 
+        batched_plan = self._batched_plans.get(modbus_registers)
+        if batched_plan is None:
+            # No plan yet for this set of due registers: build and cache it.
+            # With skip_updates in use, the due sets repeat cyclically, so the
+            # number of cached plans stays small.
+            holding_registers, input_registers = _partition_registers(
+                modbus_registers
+            )
+            batched_plan = {
+                False: _batch_sorted_registers(
+                    sorted(holding_registers, key=_ADDRESS_KEY),
+                    input_register=False,
+                ),
+                True: _batch_sorted_registers(
+                    sorted(input_registers, key=_ADDRESS_KEY),
+                    input_register=True,
+                ),
+            }
+            self._batched_plans[modbus_registers] = batched_plan
+
+        result: dict[ModbusRegister, tuple[Any, ...]] = {}
+        failed_addresses: list[int] = []
         try:
-            return await batch_read_registers(self.client, modbus_registers)
+            # The holding and input register passes are independent, so run
+            # them concurrently as well.
+            partial_results = await asyncio.gather(
+                *(
+                    _batch_read_registers_of_type(self.client, batched_registers)
+                    for batched_registers in batched_plan.values()
+                )
+            )
         except TModbusError as err:
             msg = f"Could not update values: {err}"
             raise UpdateFailed(msg) from err
 
+        for partial_result, partial_failed_addresses in partial_results:
+            result.update(partial_result)
+            failed_addresses.extend(partial_failed_addresses)
+
+        if failed_addresses:
+            total_batches = sum(len(batches) for batches in batched_plan.values())
+            if len(failed_addresses) == total_batches:
+                msg = f"All batched reads failed (addresses {failed_addresses})"
+                raise UpdateFailed(msg)
+            _LOGGER.warning(
+                "Batched reads at addresses %s failed; "
+                "their entities will be retried on the next poll",
+                failed_addresses,
+            )
+
+        if self.data:
+            # Keep the last known values of registers that were not due this
+            # cycle, so their entities do not flap to unavailable.
+            for reg, values in self.data.items():
+                if reg not in result:
+                    result[reg] = values
+
+        return result
+
 
 BaseModbusCoordinatorEntity = CoordinatorEntity[BaseModbusUpdateCoordinator]
 
-MAX_BATCHED_REGISTERS_COUNT = 64
-MAX_BATCHED_REGISTERS_GAP = 1
+MAX_BATCHED_REGISTERS_COUNT = 125
+"""Maximum number of words per batched read (Modbus limit for FC 3/4)."""
+
+MAX_WRITE_REGISTERS_COUNT = 123
+"""Maximum number of words per fused write (Modbus limit for FC 16)."""
+
+MAX_BATCHED_REGISTERS_GAP = 8
+"""
+Maximum gap (in words) between registers that is bridged by over-reading.
+
+Over-reading a small gap costs two bytes of bandwidth per word but saves a
+full extra round trip, so a generous gap pays off on any real network. Set
+to -1 to disable batching entirely for devices that do not support block
+reads.
+"""
+
+_ADDRESS_KEY = attrgetter("address")
+_INPUT_REGISTER_KEY = attrgetter("input_register")
 
 
-@dataclass(frozen=True)
-class BatchedModbusRegisters(ModbusRegister):
-    """Batched Modbus registers definition."""
+class _RegisterBatch:
+    """
+    A contiguous run of Modbus registers that is read as a single request.
 
-    original_registers: list[ModbusRegister] = field(default_factory=list)
-    """List of original Modbus registers included in this batched register."""
+    A slotted plain class rather than a dataclass: batches only live on the
+    hot per-poll read/decode path, where slot access avoids the per-instance
+    dict lookups a regular class would incur.
+    """
+
+    __slots__ = (
+        "address",
+        "input_register",
+        "original_registers",
+        "slices",
+        "struct_format",
+    )
+
+    def __init__(
+        self,
+        address: int,
+        struct_format: struct.Struct,
+        original_registers: list[ModbusRegister],
+        slices: tuple[slice, ...],
+        *,
+        input_register: bool,
+    ) -> None:
+        """Initialize the batch."""
+        self.address = address
+        self.struct_format = struct_format
+        self.original_registers = original_registers
+        self.slices = slices
+        self.input_register = input_register
+
+
+def _value_slices(value_counts: list[int]) -> tuple[slice, ...]:
+    """Precompute response-tuple slices from per-register value counts."""
+    slices: list[slice] = []
+    start = 0
+    for count in value_counts:
+        slices.append(slice(start, start + count))
+        start += count
+    return tuple(slices)
+
+
+def _partition_registers(
+    registers: Iterable[ModbusRegister],
+) -> tuple[list[ModbusRegister], list[ModbusRegister]]:
+    """Partition registers into (holding, input) lists in a single pass."""
+    holding_registers: list[ModbusRegister] = []
+    input_registers: list[ModbusRegister] = []
+    for reg in registers:
+        (input_registers if reg.input_register else holding_registers).append(reg)
+    return holding_registers, input_registers
 
 
 def batch_modbus_register(
     registers: Iterable[ModbusRegister],
     *,
     input_register: bool,
-) -> list[BatchedModbusRegisters]:
-    """Batch Modbus registers into minimal set of registers covering all addresses."""
-    # only consider registers of the requested type
-    registers = [reg for reg in registers if reg.input_register == input_register]
+    max_gap: int = MAX_BATCHED_REGISTERS_GAP,
+) -> list[_RegisterBatch]:
+    """
+    Batch Modbus registers into minimal set of registers covering all addresses.
+
+    The provided registers must be unique: duplicates are reported as
+    overlapping registers. Gaps of up to max_gap words are bridged by
+    over-reading; a negative max_gap reads every register individually.
+    """
+    # Only consider registers of the requested type. attrgetter-based
+    # filtering runs the per-register predicate in C instead of interpreting
+    # a comparison for every register.
+    if input_register:
+        registers = filter(_INPUT_REGISTER_KEY, registers)
+    else:
+        registers = filterfalse(_INPUT_REGISTER_KEY, registers)
+
+    return _batch_sorted_registers(
+        sorted(registers, key=_ADDRESS_KEY),
+        input_register=input_register,
+        max_gap=max_gap,
+    )
 
-    if not registers:
-        return []
 
-    # sorted registers contains the de-duplicated and sorted list of registers
-    sorted_registers = sorted({*registers}, key=lambda reg: reg.address)
+def _batch_sorted_registers(
+    sorted_registers: list[ModbusRegister],
+    *,
+    input_register: bool,
+    max_gap: int = MAX_BATCHED_REGISTERS_GAP,
+) -> list[_RegisterBatch]:
+    """
+    Batch a pre-sorted, pre-partitioned register list into contiguous runs.
+
+    The registers must all be of the given type, unique, and sorted by
+    address; duplicates are reported as overlapping registers. Gaps of up to
+    max_gap words are bridged with struct padding so both sides stay in one
+    read; a negative max_gap disables batching entirely.
+    """
+    if not sorted_registers:
+        return []
 
-    batched_registers: list[BatchedModbusRegisters] = []
+    batched_registers: list[_RegisterBatch] = []
 
     current_batch_start_idx = 0
-    current_batch_struct_format: str = sorted_registers[0].struct_format.format.lstrip(
-        ">"
-    )
-    current_batch_struct_size: int = sorted_registers[0].struct_format.size
+    current_batch_format_parts: list[str] = [sorted_registers[0].plain_format]
+    current_batch_word_count: int = sorted_registers[0].struct_format.size // 2
+    current_batch_value_counts: list[int] = [sorted_registers[0].value_count]
     for idx, reg in enumerate(sorted_registers[1:], start=1):
         current_end_address = (
             sorted_registers[current_batch_start_idx].address
-            + current_batch_struct_size
+            + current_batch_word_count
         )
         if reg.address < current_end_address:
             msg = f"Overlapping Modbus registers detected at address {reg.address}"
             raise ValueError(msg)
 
+        reg_word_count = reg.struct_format.size // 2
+        gap_words = reg.address - current_end_address
         if (
-            reg.address > current_end_address
-            or current_batch_struct_size > MAX_BATCHED_REGISTERS_COUNT * 2
+            max_gap < 0
+            or gap_words > max_gap
+            # The size limit is measured in words: function codes 3/4 allow at
+            # most MAX_BATCHED_REGISTERS_COUNT registers per request.
+            or current_batch_word_count + gap_words + reg_word_count
+            > MAX_BATCHED_REGISTERS_COUNT
         ):
             # gap or size limit detected, finalize current batched register
             batched_registers.append(
-                BatchedModbusRegisters(
+                _RegisterBatch(
                     address=sorted_registers[current_batch_start_idx].address,
-                    struct_format=struct.Struct(current_batch_struct_format),
+                    struct_format=struct.Struct(
+                        ">" + "".join(current_batch_format_parts)
+                    ),
                     original_registers=sorted_registers[current_batch_start_idx:idx],
+                    slices=_value_slices(current_batch_value_counts),
+                    input_register=input_register,
                 )
             )
             # start new batched register
             current_batch_start_idx = idx
-            current_batch_struct_format = reg.struct_format.format.lstrip(">")
-            current_batch_struct_size = reg.struct_format.size
+            current_batch_format_parts = [reg.plain_format]
+            current_batch_word_count = reg_word_count
+            current_batch_value_counts = [reg.value_count]
         else:
-            # extend current batched register
-            current_batch_struct_format += reg.struct_format.format.lstrip(">")
-            current_batch_struct_size += reg.struct_format.size
+            # extend current batched register, padding over any bridged gap
+            # ('x' bytes are read but decode to no values)
+            if gap_words:
+                current_batch_format_parts.append(f"{2 * gap_words}x")
+            current_batch_format_parts.append(reg.plain_format)
+            current_batch_word_count += gap_words + reg_word_count
+            current_batch_value_counts.append(reg.value_count)
 
     # finalize last batched register
     if current_batch_start_idx is not None:
-        assert current_batch_struct_format is not None
+        assert current_batch_format_parts
         batched_registers.append(
-            BatchedModbusRegisters(
+            _RegisterBatch(
                 address=sorted_registers[current_batch_start_idx].address,
-                struct_format=struct.Struct(current_batch_struct_format),
+                struct_format=struct.Struct(">" + "".join(current_batch_format_parts)),
                 original_registers=sorted_registers[current_batch_start_idx:],
+                slices=_value_slices(current_batch_value_counts),
+                input_register=input_register,
             )
         )
 
     return batched_registers
 
 
+_WORD_PACKERS: dict[int, struct.Struct] = {}
+"""Cache of Structs used to repack raw register words, keyed by word count."""
+
+
+def _words_to_bytes(words: Iterable[int]) -> bytes:
+    """Repack raw 16-bit register words into their big-endian byte form."""
+    words = tuple(words)
+    packer = _WORD_PACKERS.get(len(words))
+    if packer is None:
+        packer = _WORD_PACKERS[len(words)] = struct.Struct(f">{len(words)}H")
+    return packer.pack(*words)
+
+
+def _bytes_to_words(data: bytes) -> tuple[int, ...]:
+    """Split packed big-endian bytes into raw 16-bit register words."""
+    word_count = len(data) // 2
+    packer = _WORD_PACKERS.get(word_count)
+    if packer is None:
+        packer = _WORD_PACKERS[word_count] = struct.Struct(f">{word_count}H")
+    return packer.unpack(data)
+
+
+async def _read_batch(
+    client: AsyncModbusClient, batched_reg: _RegisterBatch
+) -> tuple[Any, ...]:
+    """
+    Read one batch of registers and decode it with the precompiled Struct.
+
+    Issues a raw register read and unpacks the response with the batch's own
+    Struct, skipping the per-call format introspection that the generic
+    read_struct_format wrapper performs.
+    """
+    word_count = batched_reg.struct_format.size // 2
+    if batched_reg.input_register:
+        words = await client.read_input_registers(batched_reg.address, word_count)
+    else:
+        words = await client.read_holding_registers(batched_reg.address, word_count)
+    return batched_reg.struct_format.unpack(_words_to_bytes(words))
+
+
 async def _batch_read_registers_of_type(
     client: AsyncModbusClient,
-    batched_registers: list[BatchedModbusRegisters],
-    *,
-    input_register: bool,
-) -> dict[ModbusRegister, tuple[Any, ...]]:
-    result: dict[ModbusRegister, tuple[Any, ...]] = {}
+    batched_registers: list[_RegisterBatch],
+) -> tuple[dict[ModbusRegister, tuple[Any, ...]], list[int]]:
+    """
+    Read and decode all given batches.
+
+    Returns the decoded values per register and the start addresses of the
+    batches whose read failed; the caller decides how to surface those.
+    """
+    failed_addresses: list[int] = []
+    # Pre-size the result dict: the final key set is known up front, so this
+    # avoids incremental dict resizes while decoding. The placeholder values
+    # are overwritten below (or dropped again for failed batches).
+    result: dict[ModbusRegister, tuple[Any, ...]] = dict.fromkeys(
+        (
+            original_reg
+            for batched_reg in batched_registers
+            for original_reg in batched_reg.original_registers
+        ),
+        (),
+    )
 
-    for batched_reg in batched_registers:
-        try:
-            response = await client.read_struct_format(
-                batched_reg.address,
-                format_struct=batched_reg.struct_format,
-                input_register=input_register,
-            )
-        except TModbusError:
-            _LOGGER.exception(
+    # Each batch is an independent read. The tmodbus transport serializes
+    # requests behind its communication lock, so the reads do not overlap on
+    # the wire; dispatching them all at once still avoids paying event-loop
+    # latency between consecutive requests.
+    responses = await asyncio.gather(
+        *(_read_batch(client, batched_reg) for batched_reg in batched_registers),
+        return_exceptions=True,
+    )
+
+    for batched_reg, response in zip(batched_registers, responses, strict=True):
+        if isinstance(response, TModbusError):
+            _LOGGER.debug(
                 "Read error while reading register %d with format %s",
                 batched_reg.address,
                 batched_reg.struct_format.format,
+                exc_info=response,
             )
+            failed_addresses.append(batched_reg.address)
+            # Skip all decode work for the failed batch and keep its
+            # registers out of the result.
+            for original_reg in batched_reg.original_registers:
+                del result[original_reg]
+            continue
+        if isinstance(response, BaseException):
+            raise response
+
+        # Standalone registers form single-entry batches whose unpacked tuple
+        # is the register value as-is, so skip the slicing machinery entirely.
+        if len(batched_reg.original_registers) == 1:
+            result[batched_reg.original_registers[0]] = response
+            continue
+
+        # Slicing a tuple with a precomputed slice object yields the
+        # per-register value tuple directly, with no running-counter
+        # arithmetic in the loop.
+        for original_reg, value_slice in zip(
+            batched_reg.original_registers, batched_reg.slices, strict=True
+        ):
+            result[original_reg] = response[value_slice]
 
-        tuple_start_idx = 0
-
-        for original_reg in batched_reg.original_registers:
-            number_of_values = len(
-                WordOrderAwareStruct.parse_format_lengths(
-                    batched_reg.struct_format.format,
-                )
-            )
-            result[original_reg] = tuple(
-                response[tuple_start_idx : tuple_start_idx + number_of_values]
+        if batched_reg.slices[-1].stop != len(response):
+            _LOGGER.debug(
+                "Batch at address %d: consumed %d of %d response values",
+                batched_reg.address,
+                batched_reg.slices[-1].stop,
+                len(response),
             )
-            tuple_start_idx += number_of_values
-
-        assert tuple_start_idx == len(response), (
-            "Not all values were consumed from the response"
-        )
-    return result
+    return result, failed_addresses
 
 
 async def batch_read_registers(
@@ -275,14 +803,25 @@ async def batch_read_registers(
     """Read multiple registers."""
     result: dict[ModbusRegister, tuple[Any, ...]] = {}
 
-    for input_register in (False, True):
-        batched_registers = batch_modbus_register(
-            registers, input_register=input_register
-        )
-        result.update(
-            await _batch_read_registers_of_type(
-                client, batched_registers, input_register=input_register
+    partial_results = await asyncio.gather(
+        *(
+            _batch_read_registers_of_type(
+                client,
+                batch_modbus_register(registers, input_register=input_register),
             )
+            for input_register in (False, True)
+        )
+    )
+    failed_addresses: list[int] = []
+    for partial_result, partial_failed_addresses in partial_results:
+        result.update(partial_result)
+        failed_addresses.extend(partial_failed_addresses)
+
+    if failed_addresses:
+        _LOGGER.warning(
+            "Batched reads at addresses %s failed; their registers are "
+            "missing from the result",
+            failed_addresses,
         )
 
     return result
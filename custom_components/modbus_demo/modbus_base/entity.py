@@ -19,6 +19,23 @@ class SimpleModbusEntityDescription(EntityDescription):
     modbus_register: ModbusRegister
 
 
+def validate_scalar_register(description: SimpleModbusEntityDescription) -> None:
+    """
+    Validate that the description's register decodes to exactly one value.
+
+    Simple entities map a single register value onto a single state. Checking
+    this invariant once at setup time replaces per-update assertions in the
+    coordinator update callbacks.
+    """
+    if description.modbus_register.value_count != 1:
+        msg = (
+            f"Register at address {description.modbus_register.address} decodes"
+            f" to {description.modbus_register.value_count} values, but"
+            f" {description.key!r} requires exactly one"
+        )
+        raise ValueError(msg)
+
+
 class BaseModbusEntity(BaseModbusCoordinatorEntity):
     """Base Modbus Entity."""
 
@@ -35,3 +52,6 @@ class BaseModbusEntity(BaseModbusCoordinatorEntity):
             },
         )
         self.entity_description = description
+        # Cached to avoid walking the entity_description attribute chain on
+        # every coordinator update.
+        self._register = description.modbus_register
@@ -7,7 +7,11 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.core import callback
 
 from .coordinator import BaseModbusUpdateCoordinator
-from .entity import BaseModbusEntity, SimpleModbusEntityDescription
+from .entity import (
+    BaseModbusEntity,
+    SimpleModbusEntityDescription,
+    validate_scalar_register,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -31,17 +35,14 @@ class SimpleModbusNumberEntity(BaseModbusEntity, NumberEntity):
         description: SimpleModbusNumberEntityDescription,
     ) -> None:
         """Initialize the Modbus number."""
+        validate_scalar_register(description)
         super().__init__(coordinator, description)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and (
-            values := self.coordinator.data.get(self.entity_description.modbus_register)
-        ):
-            assert len(values) == 1, (
-                "Expected exactly one register value for a SimpleModbusNumberEntity"
-            )
+        data = self.coordinator.data
+        if data is not None and (values := data.get(self._register)) is not None:
             value = values[0]
             if self.entity_description.scale is not None:
                 assert isinstance(value, (int, float)), (
@@ -63,10 +64,6 @@ class SimpleModbusNumberEntity(BaseModbusEntity, NumberEntity):
         if self.entity_description.scale not in (None, 0):
             to_write = value / self.entity_description.scale  # type: ignore[operator]
 
-        await self.coordinator.client.write_simple_struct_format(
-            self.entity_description.modbus_register.address,
-            to_write,
-            format_struct=self.entity_description.modbus_register.struct_format,
-        )
-        self.coordinator.data[self.entity_description.modbus_register] = (to_write,)
-        self.coordinator.async_update_listeners()
+        # queue_write packs the value with the register's precompiled Struct
+        # and handles the data update and listener notification on flush.
+        await self.coordinator.queue_write(self._register, (to_write,))
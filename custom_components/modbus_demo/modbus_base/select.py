@@ -6,7 +6,11 @@ from homeassistant.components.select import SelectEntity, SelectEntityDescriptio
 from homeassistant.core import callback
 
 from .coordinator import BaseModbusUpdateCoordinator
-from .entity import BaseModbusEntity, SimpleModbusEntityDescription
+from .entity import (
+    BaseModbusEntity,
+    SimpleModbusEntityDescription,
+    validate_scalar_register,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -30,6 +34,7 @@ class SimpleModbusSelectEntity(BaseModbusEntity, SelectEntity):
         description: SimpleModbusSelectEntityDescription,
     ) -> None:
         """Initialize the Modbus select."""
+        validate_scalar_register(description)
         # Ensure description.options reflects the mapping keys if not set
         if not description.options and description.options_map:
             # dataclasses with frozen=True prevent mutation;
@@ -40,24 +45,20 @@ class SimpleModbusSelectEntity(BaseModbusEntity, SelectEntity):
         # Keep entity options consistent with mapping, fallback to description.options
         if description.options_map:
             self._attr_options = list(description.options_map.keys())
+        # Precomputed inverse of options_map for O(1) value -> option lookups
+        self._value_to_option = {
+            value: option for option, value in description.options_map.items()
+        }
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and (
-            values := self.coordinator.data.get(self.entity_description.modbus_register)
-        ):
-            assert len(values) == 1, (
-                "Expected exactly one register value for a SimpleModbusSelectEntity"
-            )
+        data = self.coordinator.data
+        if data is not None and (values := data.get(self._register)) is not None:
             value = values[0]
             # Map value to option
-            option = None
-            for opt, reg_val in self.entity_description.options_map.items():
-                if reg_val == value:
-                    option = opt
-                    break
-            if option is None and self.entity_description.options_map:
+            option = self._value_to_option.get(value)
+            if option is None and self._value_to_option:
                 # Unknown value; mark unavailable
                 self._attr_available = False
                 self.async_write_ha_state()
@@ -82,10 +83,4 @@ class SimpleModbusSelectEntity(BaseModbusEntity, SelectEntity):
 
         to_write = self.entity_description.options_map[option]
 
-        await self.coordinator.client.write_simple_struct_format(
-            self.entity_description.modbus_register.address,
-            to_write,
-            format_struct=self.entity_description.modbus_register.struct_format,
-        )
-        self.coordinator.data[self.entity_description.modbus_register] = (to_write,)
-        self.coordinator.async_update_listeners()
+        await self.coordinator.queue_write(self._register, (to_write,))
@@ -6,10 +6,14 @@ from homeassistant.components.sensor import SensorEntity, SensorEntityDescriptio
 from homeassistant.core import callback
 
 from .coordinator import BaseModbusUpdateCoordinator
-from .entity import BaseModbusEntity, SimpleModbusEntityDescription
+from .entity import (
+    BaseModbusEntity,
+    SimpleModbusEntityDescription,
+    validate_scalar_register,
+)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SimpleModbusSensorEntityDescription(
     SimpleModbusEntityDescription, SensorEntityDescription
 ):
@@ -30,17 +34,14 @@ class SimpleModbusSensorEntity(BaseModbusEntity, SensorEntity):
         description: SimpleModbusSensorEntityDescription,
     ) -> None:
         """Initialize the Modbus sensor."""
+        validate_scalar_register(description)
         super().__init__(coordinator, description)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and (
-            values := self.coordinator.data.get(self.entity_description.modbus_register)
-        ):
-            assert len(values) == 1, (
-                "Expected exactly one register value for a SimpleModbusSensorEntity"
-            )
+        data = self.coordinator.data
+        if data is not None and (values := data.get(self._register)) is not None:
             value = values[0]
             if self.entity_description.scale is not None:
                 assert isinstance(value, (int, float)), (
@@ -7,10 +7,14 @@ from homeassistant.components.switch import SwitchEntity, SwitchEntityDescriptio
 from homeassistant.core import callback
 
 from .coordinator import BaseModbusUpdateCoordinator
-from .entity import BaseModbusEntity, SimpleModbusEntityDescription
+from .entity import (
+    BaseModbusEntity,
+    SimpleModbusEntityDescription,
+    validate_scalar_register,
+)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SimpleModbusSwitchEntityDescription(
     SimpleModbusEntityDescription, SwitchEntityDescription
 ):
@@ -31,56 +35,63 @@ class SimpleModbusSwitchEntity(BaseModbusEntity, SwitchEntity):
         description: SimpleModbusSwitchEntityDescription,
     ) -> None:
         """Initialize the Modbus switch."""
+        validate_scalar_register(description)
         super().__init__(coordinator, description)
+        # The on/off payloads are fixed by the (frozen) description, so pack
+        # them once here instead of on every toggle.
+        register = description.modbus_register
+        self._on_words = register.pack_words(description.on_value)
+        self._off_words = register.pack_words(description.off_value)
+        self._on_tuple = (description.on_value,)
+        self._off_tuple = (description.off_value,)
+        # Map register value to is_on state with a single dict lookup instead
+        # of an if/elif chain on every coordinator update.
+        self._state_map = {description.on_value: True, description.off_value: False}
+        # Last (is_on, available) pair pushed to Home Assistant, used to
+        # elide no-op state writes.
+        self._last_written_state: tuple[bool | None, bool] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and (
-            values := self.coordinator.data.get(self.entity_description.modbus_register)
-        ):
-            assert len(values) == 1, (
-                "Expected exactly one register value for a SimpleModbusSensorEntity"
-            )
+        data = self.coordinator.data
+        if data is not None and (values := data.get(self._register)) is not None:
             value = values[0]
 
-            if value == self.entity_description.on_value:
-                self._attr_is_on = True
-            elif value == self.entity_description.off_value:
-                self._attr_is_on = False
-            else:
+            state = self._state_map.get(value)
+            if state is None:
                 msg = (
                     f"Received unexpected value {value} for switch: "
                     f"only {self.entity_description.on_value} and "
                     f"{self.entity_description.off_value} are supported"
                 )
                 raise ValueError(msg)
+            self._attr_is_on = state
             self._attr_available = True
         else:
             self._attr_available = False
 
+        # In steady state polling mostly re-reads unchanged values; skip the
+        # state machine, event bus and recorder entirely in that case. The
+        # comparison must use the available property (not _attr_available):
+        # CoordinatorEntity derives availability from last_update_success, so
+        # a failed poll changes the property while the data stays the same.
+        state = (self._attr_is_on, self.available)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on the device."""
-        await self.coordinator.client.write_simple_struct_format(
-            self.entity_description.modbus_register.address,
-            self.entity_description.on_value,
-            format_struct=self.entity_description.modbus_register.struct_format,
+        # Queueing the write lets the coordinator fuse it with writes of other
+        # switches toggled in the same event-loop iteration (e.g. scenes).
+        await self.coordinator.queue_write(
+            self._register, self._on_tuple, words=self._on_words
         )
-        self.coordinator.data[self.entity_description.modbus_register] = (
-            self.entity_description.on_value,
-        )
-        self.coordinator.async_update_listeners()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off the device."""
-        await self.coordinator.client.write_simple_struct_format(
-            self.entity_description.modbus_register.address,
-            self.entity_description.off_value,
-            format_struct=self.entity_description.modbus_register.struct_format,
-        )
-        self.coordinator.data[self.entity_description.modbus_register] = (
-            self.entity_description.off_value,
+        await self.coordinator.queue_write(
+            self._register, self._off_tuple, words=self._off_words
         )
-        self.coordinator.async_update_listeners()
@@ -23,6 +23,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, "demo_device")},
+    name="Modbus Demo Device",
+    manufacturer="Modbus Demo Inc.",
+    model="Demo Model 1",
+)
+"""Shared by all demo sensors; built once instead of per device_info access."""
+
 SENSORS: list[SimpleModbusSensorEntityDescription] = [
     SimpleModbusSensorEntityDescription(
         key="minute_of_hour",
@@ -44,6 +52,8 @@ SENSORS: list[SimpleModbusSensorEntityDescription] = [
 class ModbusDemoSensorEntity(SimpleModbusSensorEntity):
     """Demo Modbus sensor entity."""
 
+    _attr_device_info = _DEVICE_INFO
+
     def __init__(
         self,
         coordinator: BaseModbusUpdateCoordinator,
@@ -55,16 +65,6 @@ class ModbusDemoSensorEntity(SimpleModbusSensorEntity):
         # for example: prefix with serial number
         self.unique_id = f"modbus_demo_sensor_{description.key}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the sensor."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, "demo_device")},
-            name="Modbus Demo Device",
-            manufacturer="Modbus Demo Inc.",
-            model="Demo Model 1",
-        )
-
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -77,10 +77,14 @@ async def async_setup_entry(
         config_entry.entry_id,
     )
 
+    # One grouped refresh up front instead of update_before_add=True, which
+    # would serialize a Modbus round trip per entity before adding it.
+    await config_entry.runtime_data.coordinator.async_config_entry_first_refresh()
+
     async_add_entities(
         [
             ModbusDemoSensorEntity(config_entry.runtime_data.coordinator, sensor)
             for sensor in SENSORS
         ],
-        update_before_add=True,
+        update_before_add=False,
     )